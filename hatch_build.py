@@ -0,0 +1,89 @@
+"""Optional Cython compilation of the pydantic models for wheel builds.
+
+Set ``MCP_COMPILE=1`` when building a wheel to compile the model modules
+into extension modules. The ``.py`` sources are still shipped, so the pure
+Python implementation remains the fallback wherever the compiled modules
+cannot be loaded.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# Model modules compiled when MCP_COMPILE is enabled
+COMPILED_MODULES = [
+    "src/mcp_atlassian/models/base.py",
+    "src/mcp_atlassian/models/confluence/*.py",
+]
+
+# Cython 3 keeps class-body annotations, which pydantic needs to build fields
+BUILD_DEPENDENCIES = ["cython>=3", "setuptools"]
+
+
+def _compile_enabled() -> bool:
+    return os.getenv("MCP_COMPILE", "").lower() in ("1", "true", "yes")
+
+
+class CythonBuildHook(BuildHookInterface):
+    """Build hook that cythonizes the model modules when MCP_COMPILE is set."""
+
+    PLUGIN_NAME = "custom"
+
+    def dependencies(self) -> list[str]:
+        return BUILD_DEPENDENCIES if _compile_enabled() else []
+
+    _build_root: str | None = None
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if self.target_name != "wheel" or not _compile_enabled():
+            return
+
+        # Build outside the source tree so no stale extensions shadow src/
+        self._build_root = tempfile.mkdtemp(prefix="mcp-atlassian-cython-")
+
+        from Cython.Build import cythonize
+        from setuptools import Distribution
+
+        extensions = cythonize(
+            COMPILED_MODULES,
+            exclude=["src/mcp_atlassian/models/confluence/__init__.py"],
+            build_dir=os.path.join(self._build_root, "cython"),
+            language_level=3,
+            compiler_directives={
+                # wraparound stays enabled: the models index with negative offsets
+                "boundscheck": False,
+                # Keep annotations as hints only, so e.g. ``data: dict`` still
+                # accepts None exactly like the pure Python modules
+                "annotation_typing": False,
+            },
+            force=True,
+            quiet=True,
+        )
+        distribution = Distribution(
+            {"ext_modules": extensions, "package_dir": {"": "src"}}
+        )
+        build_ext = distribution.get_command_obj("build_ext")
+        build_ext.build_lib = os.path.join(self._build_root, "lib")
+        build_ext.build_temp = os.path.join(self._build_root, "temp")
+        build_ext.ensure_finalized()
+        build_ext.run()
+
+        for extension in extensions:
+            filename = build_ext.get_ext_filename(extension.name)
+            build_data["force_include"][os.path.join(build_ext.build_lib, filename)] = (
+                filename
+            )
+        build_data["pure_python"] = False
+        build_data["infer_tag"] = True
+
+    def finalize(
+        self, version: str, build_data: dict[str, Any], artifact_path: str
+    ) -> None:
+        if self._build_root is not None:
+            shutil.rmtree(self._build_root, ignore_errors=True)
+            self._build_root = None
@@ -4,30 +4,67 @@ Pydantic models for Confluence API responses.
 This package provides type-safe models for working with Atlassian API data,
 including conversion methods from API responses to structured models and
 simplified dictionaries for API responses.
+
+Re-exports are resolved lazily (PEP 562), so importing this package does not
+build any pydantic model classes until one of them is first accessed.
 """
 
-# Re-export models for easier imports
-from .base import ApiModel, TimestampMixin
-from .confluence import (
-    ConfluenceAttachment,
-    ConfluenceComment,
-    ConfluenceLabel,
-    ConfluencePage,
-    ConfluenceSearchResult,
-    ConfluenceSpace,
-    ConfluenceUser,
-    ConfluenceVersion,
-)
-from .constants import (
-    CONFLUENCE_DEFAULT_ID,
-    CONFLUENCE_DEFAULT_SPACE,
-    CONFLUENCE_DEFAULT_VERSION,
-    DEFAULT_TIMESTAMP,
-    EMPTY_STRING,
-    NONE_VALUE,
-    UNKNOWN,
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import ApiModel, TimestampMixin
+    from .confluence import (
+        ConfluenceAttachment,
+        ConfluenceComment,
+        ConfluenceLabel,
+        ConfluencePage,
+        ConfluenceSearchResult,
+        ConfluenceSpace,
+        ConfluenceUser,
+        ConfluenceVersion,
+    )
+    from .constants import (
+        CONFLUENCE_DEFAULT_ID,
+        CONFLUENCE_DEFAULT_SPACE,
+        CONFLUENCE_DEFAULT_VERSION,
+        DEFAULT_TIMESTAMP,
+        EMPTY_STRING,
+        NONE_VALUE,
+        UNKNOWN,
+    )
+
+# Whether the model modules were loaded from Cython extensions (MCP_COMPILE=1)
+_base_spec = importlib.util.find_spec(f"{__name__}.base")
+compiled: bool = bool(
+    _base_spec and _base_spec.origin and _base_spec.origin.endswith((".so", ".pyd"))
 )
 
+# Maps each re-exported name to the submodule that defines it
+_LAZY: dict[str, str] = {
+    # Base models
+    "ApiModel": ".base",
+    "TimestampMixin": ".base",
+    # Constants
+    "CONFLUENCE_DEFAULT_ID": ".constants",
+    "CONFLUENCE_DEFAULT_SPACE": ".constants",
+    "CONFLUENCE_DEFAULT_VERSION": ".constants",
+    "DEFAULT_TIMESTAMP": ".constants",
+    "EMPTY_STRING": ".constants",
+    "NONE_VALUE": ".constants",
+    "UNKNOWN": ".constants",
+    # Confluence models
+    "ConfluenceUser": ".confluence",
+    "ConfluenceSpace": ".confluence",
+    "ConfluencePage": ".confluence",
+    "ConfluenceComment": ".confluence",
+    "ConfluenceLabel": ".confluence",
+    "ConfluenceVersion": ".confluence",
+    "ConfluenceSearchResult": ".confluence",
+    "ConfluenceAttachment": ".confluence",
+}
+
 # Additional models will be added as they are implemented
 
 __all__ = [
@@ -52,3 +89,21 @@ __all__ = [
     "ConfluenceSearchResult",
     "ConfluenceAttachment",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its submodule on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names for autocompletion."""
+    return sorted(set(globals()) | set(__all__))
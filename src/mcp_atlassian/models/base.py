@@ -6,10 +6,13 @@ Jira and Confluence models to ensure consistent behavior and reduce
 code duplication.
 """
 
+from __future__ import annotations
+
+import types
 from datetime import datetime
 from typing import Any, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .constants import EMPTY_STRING
 
@@ -17,6 +20,20 @@ from .constants import EMPTY_STRING
 T = TypeVar("T", bound="ApiModel")
 
 
+def _function_type_probe() -> None:
+    """Reveal the runtime type of functions defined in this module."""
+
+
+# When compiled with Cython (MCP_COMPILE=1) methods are ``cyfunction`` objects,
+# which pydantic would otherwise mistake for non-annotated fields. Pure Python
+# builds keep pydantic's default (no extra ignored types).
+_COMPILED_FUNCTION_TYPES: tuple[type, ...] = (
+    (type(_function_type_probe),)
+    if type(_function_type_probe) is not types.FunctionType
+    else ()
+)
+
+
 class ApiModel(BaseModel):
     """
     Base model for all API models with common conversion methods.
@@ -26,6 +43,8 @@ class ApiModel(BaseModel):
     for API responses.
     """
 
+    model_config = ConfigDict(ignored_types=_COMPILED_FUNCTION_TYPES)
+
     @classmethod
     def from_api_response(cls: type[T], data: dict[str, Any], **kwargs: Any) -> T:
         """
@@ -3,6 +3,8 @@ Confluence comment models.
 This module provides Pydantic models for Confluence page comments.
 """
 
+from __future__ import annotations
+
 import logging
 from typing import Any
 
@@ -34,7 +36,7 @@ class ConfluenceComment(ApiModel, TimestampMixin):
     @classmethod
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceComment":
+    ) -> ConfluenceComment:
         """
         Create a ConfluenceComment from a Confluence API response.
 
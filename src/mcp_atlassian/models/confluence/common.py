@@ -4,6 +4,8 @@ This module provides Pydantic models for common Confluence entities like users
 and attachments.
 """
 
+from __future__ import annotations
+
 import logging
 import warnings
 from typing import Any
@@ -43,7 +45,7 @@ class ConfluenceUser(ApiModel):
         return self.display_name
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "ConfluenceUser":
+    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> ConfluenceUser:
         """
         Create a ConfluenceUser from a Confluence API response.
 
@@ -94,7 +96,7 @@ class ConfluenceAttachment(ApiModel):
     @classmethod
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceAttachment":
+    ) -> ConfluenceAttachment:
         """
         Create a ConfluenceAttachment from a Confluence API response.
 
@@ -3,6 +3,8 @@ Confluence label models.
 This module provides Pydantic models for Confluence page labels.
 """
 
+from __future__ import annotations
+
 import logging
 from typing import Any
 
@@ -27,9 +29,7 @@ class ConfluenceLabel(ApiModel):
     type: str = "label"
 
     @classmethod
-    def from_api_response(
-        cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceLabel":
+    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> ConfluenceLabel:
         """
         Create a ConfluenceLabel from a Confluence API response.
 
@@ -3,6 +3,8 @@ Confluence page models.
 This module provides Pydantic models for Confluence pages and their versions.
 """
 
+from __future__ import annotations
+
 import logging
 import warnings
 from typing import Any
@@ -35,7 +37,7 @@ class ConfluenceVersion(ApiModel, TimestampMixin):
     @classmethod
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceVersion":
+    ) -> ConfluenceVersion:
         """
         Create a ConfluenceVersion from a Confluence API response.
 
@@ -111,7 +113,7 @@ class ConfluencePage(ApiModel, TimestampMixin):
         return self.content
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "ConfluencePage":
+    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> ConfluencePage:
         """
         Create a ConfluencePage from a Confluence API response.
 
@@ -3,6 +3,8 @@ Confluence search result models.
 This module provides Pydantic models for Confluence search (CQL) results.
 """
 
+from __future__ import annotations
+
 import logging
 from typing import Any
 
@@ -31,7 +33,7 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
     @classmethod
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceSearchResult":
+    ) -> ConfluenceSearchResult:
         """
         Create a ConfluenceSearchResult from a Confluence API response.
 
@@ -64,7 +66,7 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
         )
 
     @model_validator(mode="after")
-    def validate_search_result(self) -> "ConfluenceSearchResult":
+    def validate_search_result(self) -> ConfluenceSearchResult:
         """Validate the search result and log warnings if needed."""
         if self.total_size > 0 and not self.results:
             logger.warning(
@@ -3,6 +3,8 @@ Confluence space models.
 This module provides Pydantic models for Confluence spaces.
 """
 
+from __future__ import annotations
+
 import logging
 from typing import Any
 
@@ -24,9 +26,7 @@ class ConfluenceSpace(ApiModel):
     status: str = "current"  # "current", "archived", etc.
 
     @classmethod
-    def from_api_response(
-        cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceSpace":
+    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> ConfluenceSpace:
         """
         Create a ConfluenceSpace from a Confluence API response.
 
@@ -3,6 +3,8 @@ Confluence user search result models.
 This module provides Pydantic models for Confluence user search results.
 """
 
+from __future__ import annotations
+
 import logging
 from typing import Any
 
@@ -30,7 +32,7 @@ class ConfluenceUserSearchResult(ApiModel):
     @classmethod
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceUserSearchResult":
+    ) -> ConfluenceUserSearchResult:
         """
         Create a ConfluenceUserSearchResult from a Confluence API response.
 
@@ -102,7 +104,7 @@ class ConfluenceUserSearchResults(ApiModel, TimestampMixin):
     @classmethod
     def from_api_response(
         cls, data: dict[str, Any], **kwargs: Any
-    ) -> "ConfluenceUserSearchResults":
+    ) -> ConfluenceUserSearchResults:
         """
         Create a ConfluenceUserSearchResults from a Confluence API response.
 
@@ -3,7 +3,7 @@
 import logging
 import ssl
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from requests.adapters import HTTPAdapter
 from requests.sessions import Session
@@ -76,7 +76,8 @@ def configure_ssl_verification(
 
     If SSL verification is disabled, this function will configure the session
     to use a custom SSL adapter that bypasses certificate validation for the
-    service's domain.
+    service's domain. Calling it again for a domain that already has the
+    adapter mounted leaves the session unchanged.
 
     Args:
         service_name: Name of the service for logging (e.g., "Confluence", "Jira")
@@ -90,7 +91,11 @@ def configure_ssl_verification(
         )
 
         # Get the domain from the configured URL
-        domain = urlparse(url).netloc
+        domain = urlsplit(url).netloc
+
+        # Reuse the adapter (and its connection pools) if already mounted
+        if isinstance(session.adapters.get(f"https://{domain}"), SSLIgnoreAdapter):
+            return
 
         # Mount the adapter to handle requests to this domain
         adapter = SSLIgnoreAdapter()
@@ -36,12 +36,46 @@ from mcp_atlassian.models.confluence import (
 from mcp_atlassian.servers import main_mcp
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def confluence_config() -> ConfluenceConfig:
-    """Create a ConfluenceConfig from environment variables."""
+    """Create a ConfluenceConfig from environment variables once per session."""
     return ConfluenceConfig.from_env()
 
 
+@pytest.fixture(scope="class")
+def real_confluence_config(request: pytest.FixtureRequest) -> ConfluenceConfig:
+    """Get the session ConfluenceConfig, skipping unless --use-real-data is set."""
+    if not request.config.getoption("--use-real-data"):
+        pytest.skip("Real Confluence data testing is disabled")
+    return request.getfixturevalue("confluence_config")
+
+
+@pytest.fixture(scope="class")
+def pages_client(real_confluence_config: ConfluenceConfig) -> PagesMixin:
+    """Create a PagesMixin shared by the tests of a class."""
+    return PagesMixin(config=real_confluence_config)
+
+
+@pytest.fixture(scope="class")
+def comments_client(
+    real_confluence_config: ConfluenceConfig,
+) -> ConfluenceCommentsMixin:
+    """Create a CommentsMixin shared by the tests of a class."""
+    return ConfluenceCommentsMixin(config=real_confluence_config)
+
+
+@pytest.fixture(scope="class")
+def labels_client(real_confluence_config: ConfluenceConfig) -> ConfluenceLabelsMixin:
+    """Create a LabelsMixin shared by the tests of a class."""
+    return ConfluenceLabelsMixin(config=real_confluence_config)
+
+
+@pytest.fixture(scope="class")
+def search_client(real_confluence_config: ConfluenceConfig) -> ConfluenceSearchMixin:
+    """Create a SearchMixin shared by the tests of a class."""
+    return ConfluenceSearchMixin(config=real_confluence_config)
+
+
 @pytest.fixture
 def confluence_client(confluence_config: ConfluenceConfig) -> ConfluenceFetcher:
     """Create a ConfluenceFetcher instance."""
@@ -95,14 +129,8 @@ class TestRealConfluenceValidation:
     2. The required Confluence environment variables are not set
     """
 
-    def test_get_page_content(self, use_real_confluence_data, test_page_id):
+    def test_get_page_content(self, pages_client, test_page_id):
         """Test that get_page_content returns a proper ConfluencePage model."""
-        if not use_real_confluence_data:
-            pytest.skip("Real Confluence data testing is disabled")
-
-        config = ConfluenceConfig.from_env()
-        pages_client = PagesMixin(config=config)
-
         page = pages_client.get_page_content(test_page_id)
 
         assert isinstance(page, ConfluencePage)
@@ -115,14 +143,8 @@ class TestRealConfluenceValidation:
 
         assert page.content_format in ["storage", "view", "markdown"]
 
-    def test_get_page_comments(self, use_real_confluence_data, test_page_id):
+    def test_get_page_comments(self, comments_client, test_page_id):
         """Test that page comments are properly converted to ConfluenceComment models."""
-        if not use_real_confluence_data:
-            pytest.skip("Real Confluence data testing is disabled")
-
-        config = ConfluenceConfig.from_env()
-        comments_client = ConfluenceCommentsMixin(config=config)
-
         comments = comments_client.get_page_comments(test_page_id)
 
         if len(comments) == 0:
@@ -133,14 +155,8 @@ class TestRealConfluenceValidation:
             assert comment.id is not None
             assert comment.body is not None
 
-    def test_get_page_labels(self, use_real_confluence_data, test_page_id):
+    def test_get_page_labels(self, labels_client, test_page_id):
         """Test that page labels are properly converted to ConfluenceLabel models."""
-        if not use_real_confluence_data:
-            pytest.skip("Real Confluence data testing is disabled")
-
-        config = ConfluenceConfig.from_env()
-        labels_client = ConfluenceLabelsMixin(config=config)
-
         labels = labels_client.get_page_labels(test_page_id)
 
         if len(labels) == 0:
@@ -151,14 +167,8 @@ class TestRealConfluenceValidation:
             assert label.id is not None
             assert label.name is not None
 
-    def test_search_content(self, use_real_confluence_data):
+    def test_search_content(self, search_client):
         """Test that search returns ConfluencePage models."""
-        if not use_real_confluence_data:
-            pytest.skip("Real Confluence data testing is disabled")
-
-        config = ConfluenceConfig.from_env()
-        search_client = ConfluenceSearchMixin(config=config)
-
         cql = 'type = "page" ORDER BY created DESC'
         results = search_client.search(cql, limit=5)
 
@@ -66,6 +66,18 @@ class TestPagesMixin:
         assert result.attachments[0].id is not None
         assert result.attachments[1].id is not None
 
+    def test_get_page_content_format_and_simplified_dict(self, pages_mixin):
+        """Test the content format and simplified output of get_page_content."""
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+
+        result = pages_mixin.get_page_content("987654321", convert_to_markdown=True)
+
+        assert result.content_format in ["storage", "view", "markdown"]
+        assert result.to_simplified_dict()["content"] == {
+            "value": "Processed Markdown",
+            "format": "markdown",
+        }
+
     def test_get_page_ancestors(self, pages_mixin):
         """Test getting page ancestors (parent pages)."""
         # Arrange
@@ -2,6 +2,8 @@
 Tests for the base models and utility classes.
 """
 
+import subprocess
+import sys
 from typing import Any
 
 import pytest
@@ -41,6 +43,14 @@ class TestApiModel:
         assert result["field1"] == "test"
         assert result["field2"] == 123
 
+    def test_pure_python_build_keeps_default_ignored_types(self):
+        """Test that the Cython workaround only applies to compiled builds."""
+        import src.mcp_atlassian.models.base as base
+
+        if base.__file__.endswith((".so", ".pyd")):
+            pytest.skip("Model modules are compiled")
+        assert ApiModel.model_config["ignored_types"] == ()
+
 
 class TestTimestampMixin:
     """Tests for the TimestampMixin utility class."""
@@ -106,3 +116,50 @@ class TestTimestampMixin:
         formatter = TimestampMixin()
 
         assert formatter.is_valid_timestamp(invalid_timestamp) is False
+
+
+class TestLazyModelExports:
+    """Tests for the lazy re-exports in the models package."""
+
+    def test_package_import_does_not_load_confluence_models(self):
+        """Test that importing the package alone defers the Confluence models."""
+        code = (
+            "import sys\n"
+            "import mcp_atlassian.models\n"
+            "assert 'mcp_atlassian.models.confluence' not in sys.modules\n"
+            "from mcp_atlassian.models import ConfluencePage\n"
+            "assert 'mcp_atlassian.models.confluence' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_lazy_attribute_resolves_to_defining_class(self):
+        """Test that lazily exported names match their defining modules."""
+        import src.mcp_atlassian.models as models
+        from src.mcp_atlassian.models.confluence.page import ConfluencePage
+
+        assert models.ConfluencePage is ConfluencePage
+        assert models.ApiModel is ApiModel
+        assert models.EMPTY_STRING == EMPTY_STRING
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        import src.mcp_atlassian.models as models
+
+        with pytest.raises(AttributeError):
+            models.DoesNotExist  # noqa: B018
+
+    def test_dir_lists_lazy_exports(self):
+        """Test that dir() advertises every name in __all__."""
+        import src.mcp_atlassian.models as models
+
+        assert set(models.__all__) <= set(dir(models))
+
+    def test_compiled_flag_reflects_base_module_origin(self):
+        """Test that the compiled flag matches how the base module was loaded."""
+        import src.mcp_atlassian.models as models
+        import src.mcp_atlassian.models.base as base
+
+        assert models.compiled is base.__file__.endswith((".so", ".pyd"))
@@ -13,8 +13,12 @@ class MockEnvironment:
 
     @staticmethod
     @contextmanager
-    def oauth_env():
-        """Context manager for OAuth environment variables."""
+    def oauth_env(extra: dict[str, str] | None = None):
+        """Context manager for OAuth environment variables.
+
+        Args:
+            extra: Additional variables to set in the same environment patch
+        """
         oauth_vars = AuthConfigFactory.create_oauth_config()
         env_vars = {
             "ATLASSIAN_OAUTH_CLIENT_ID": oauth_vars["client_id"],
@@ -22,19 +26,25 @@ class MockEnvironment:
             "ATLASSIAN_OAUTH_REDIRECT_URI": oauth_vars["redirect_uri"],
             "ATLASSIAN_OAUTH_SCOPE": oauth_vars["scope"],
             "ATLASSIAN_OAUTH_CLOUD_ID": oauth_vars["cloud_id"],
+            **(extra or {}),
         }
         with patch.dict(os.environ, env_vars, clear=False):
             yield env_vars
 
     @staticmethod
     @contextmanager
-    def basic_auth_env():
-        """Context manager for basic auth environment variables."""
+    def basic_auth_env(extra: dict[str, str] | None = None):
+        """Context manager for basic auth environment variables.
+
+        Args:
+            extra: Additional variables to set in the same environment patch
+        """
         auth_config = AuthConfigFactory.create_basic_auth_config()
         env_vars = {
             "CONFLUENCE_URL": f"{auth_config['url']}/wiki",
             "CONFLUENCE_USERNAME": auth_config["username"],
             "CONFLUENCE_API_TOKEN": auth_config["api_token"],
+            **(extra or {}),
         }
         with patch.dict(os.environ, env_vars, clear=False):
             yield env_vars